@@ -12,10 +12,13 @@ Exit codes:
     1 - Plan has issues (missing sections or placeholders)
 """
 
+import bisect
+import functools
 import sys
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 
 # Required sections in plan.md
 REQUIRED_SECTIONS = [
@@ -41,57 +44,96 @@ INCOMPLETE_PATTERNS = [
     r"\[Option \d+:",  # Indicates un-chosen structure options
 ]
 
+# All patterns are ASCII, so both scripts operate on raw bytes: no UTF-8
+# decode of the whole file, and `re` on bytes scans a smaller buffer.
+# Matched snippets are decoded on demand when reported.
 
-def read_file(file_path: Path) -> str:
-    """Read file content."""
+# Single alternation so the whole document is scanned once, not once per pattern
+_INCOMPLETE_RE = re.compile(
+    "|".join(f"(?:{pattern})" for pattern in INCOMPLETE_PATTERNS).encode('ascii'),
+    re.IGNORECASE
+)
+
+# Match headers: ## Section Name
+_SECTION_RE = re.compile(rb'^##\s+(.+)$', re.MULTILINE)
+
+# Un-removed structure option labels
+_OPTION_RE = re.compile(rb'Option \d+:')
+
+
+def read_file(file_path: Path) -> bytes:
+    """Read file content as raw bytes, with newlines normalized to LF."""
     try:
-        return file_path.read_text(encoding='utf-8')
+        # read_text() translated universal newlines; keep that behavior so
+        # offsets and section boundaries match on CRLF plans
+        return file_path.read_bytes().replace(b'\r\n', b'\n')
     except Exception as e:
         print(f"Error reading file: {e}")
         sys.exit(1)
 
 
-def extract_sections(content: str) -> List[str]:
-    """Extract section headers from markdown content."""
-    # Match headers: ## Section Name
-    pattern = r'^##\s+(.+)$'
-    return re.findall(pattern, content, re.MULTILINE)
+def scan_sections(content: bytes) -> Tuple[List[bytes], Dict[bytes, bytes]]:
+    """Scan section headers once: names plus lowercased-name -> body map.
+
+    One linear pass replaces the separate per-section body regexes.
+    """
+    names = []
+    section_map = {}
+    matches = list(_SECTION_RE.finditer(content))
+    for i, match in enumerate(matches):
+        name = match.group(1)
+        names.append(name)
+        body_end = matches[i + 1].start() if i + 1 < len(matches) else len(content)
+        section_map[name.strip().lower()] = content[match.end():body_end]
+    return names, section_map
+
+
+def _find_section(section_map: Dict[bytes, bytes], name: bytes) -> 'bytes | None':
+    """Look up a section body by (case-insensitive, partial) name."""
+    for key, body in section_map.items():
+        if name in key:
+            return body
+    return None
 
 
-def check_required_sections(sections: List[str]) -> Tuple[bool, List[str]]:
+def check_required_sections(sections: List[bytes]) -> Tuple[bool, List[str]]:
     """Check if all required sections are present."""
     missing = []
     for required in REQUIRED_SECTIONS:
-        if not any(required.lower() in section.lower() for section in sections):
+        required_lower = required.lower().encode('ascii')
+        if not any(required_lower in section.lower() for section in sections):
             missing.append(required)
     return len(missing) == 0, missing
 
 
-def check_incomplete_patterns(content: str) -> Tuple[bool, List[Tuple[str, int]]]:
+def build_line_starts(content: bytes) -> List[int]:
+    """Offsets where each line begins; built once per plan and shared by any
+    check that reports line numbers."""
+    return [0] + [m.end() for m in re.finditer(b'\n', content)]
+
+
+def offset_to_line(line_starts: List[int], offset: int) -> int:
+    """Map a byte offset to a 1-based line number in O(log n)."""
+    return bisect.bisect_right(line_starts, offset)
+
+
+def check_incomplete_patterns(content: bytes,
+                              line_starts: List[int]) -> Tuple[bool, List[Tuple[str, int]]]:
     """Check for incomplete placeholder patterns."""
     issues = []
-    for pattern in INCOMPLETE_PATTERNS:
-        matches = re.finditer(pattern, content, re.IGNORECASE)
-        for match in matches:
-            # Find line number
-            line_num = content[:match.start()].count('\n') + 1
-            issues.append((match.group(0), line_num))
+    for match in _INCOMPLETE_RE.finditer(content):
+        line_num = offset_to_line(line_starts, match.start())
+        issues.append((match.group(0).decode('utf-8', 'replace'), line_num))
     return len(issues) == 0, issues
 
 
-def check_technical_context_filled(content: str) -> Tuple[bool, List[str]]:
+def check_technical_context_filled(section_map: Dict[bytes, bytes]) -> Tuple[bool, List[str]]:
     """Check if Technical Context fields are filled."""
-    context_section = re.search(
-        r'##\s+Technical Context\s*(.+?)(?=##|\Z)',
-        content,
-        re.DOTALL | re.IGNORECASE
-    )
+    context_content = _find_section(section_map, b'technical context')
 
-    if not context_section:
+    if context_content is None:
         return False, ["Technical Context section not found"]
 
-    context_content = context_section.group(1)
-
     # Required fields in Technical Context
     required_fields = [
         "Language/Version",
@@ -102,33 +144,27 @@ def check_technical_context_filled(content: str) -> Tuple[bool, List[str]]:
 
     missing = []
     for field in required_fields:
-        if field not in context_content:
+        if field.encode('ascii') not in context_content:
             missing.append(field)
 
     return len(missing) == 0, missing
 
 
-def check_project_structure(content: str) -> Tuple[bool, List[str]]:
+def check_project_structure(section_map: Dict[bytes, bytes]) -> Tuple[bool, List[str]]:
     """Check if Project Structure is concrete (no Option 1/2/3 remaining)."""
-    structure_section = re.search(
-        r'##\s+Project Structure\s*(.+?)(?=##|\Z)',
-        content,
-        re.DOTALL | re.IGNORECASE
-    )
+    structure_content = _find_section(section_map, b'project structure')
 
-    if not structure_section:
+    if structure_content is None:
         return False, ["Project Structure section not found"]
 
-    structure_content = structure_section.group(1)
-
     issues = []
 
     # Check for un-removed option labels
-    if re.search(r'Option \d+:', structure_content):
+    if _OPTION_RE.search(structure_content):
         issues.append("Project Structure contains 'Option X:' labels - remove unused options")
 
-    # Check for REMOVE IF UNUSED markers
-    if re.search(r'\[REMOVE IF UNUSED\]', structure_content, re.IGNORECASE):
+    # Check for REMOVE IF UNUSED markers (literal string, no regex needed)
+    if b'[remove if unused]' in structure_content.lower():
         issues.append("Project Structure contains '[REMOVE IF UNUSED]' markers")
 
     return len(issues) == 0, issues
@@ -136,17 +172,15 @@ def check_project_structure(content: str) -> Tuple[bool, List[str]]:
 
 def validate_plan(file_path: Path) -> Tuple[bool, dict]:
     """Validate plan.md completeness."""
-    print(f"Validating plan: {file_path}")
-    print("-" * 60)
-
     content = read_file(file_path)
-    sections = extract_sections(content)
+    sections, section_map = scan_sections(content)
+    line_starts = build_line_starts(content)
 
     results = {
         'required_sections': check_required_sections(sections),
-        'incomplete_patterns': check_incomplete_patterns(content),
-        'technical_context': check_technical_context_filled(content),
-        'project_structure': check_project_structure(content),
+        'incomplete_patterns': check_incomplete_patterns(content, line_starts),
+        'technical_context': check_technical_context_filled(section_map),
+        'project_structure': check_project_structure(section_map),
     }
 
     all_passed = all(result[0] for result in results.values())
@@ -154,6 +188,22 @@ def validate_plan(file_path: Path) -> Tuple[bool, dict]:
     return all_passed, results
 
 
+@functools.lru_cache(maxsize=256)
+def _validate_cached(path_str: str, mtime_ns: int, size: int) -> Tuple[bool, dict]:
+    """Cache entry: mtime/size in the key invalidate on file change."""
+    return validate_plan(Path(path_str))
+
+
+def validate_plan_cached(file_path: Path) -> Tuple[bool, dict]:
+    """Validate a plan, reusing the cached result while the file is unchanged.
+
+    Useful for long-running callers (watchers, pre-commit over many plans)
+    that validate the same files repeatedly.
+    """
+    stat = file_path.stat()
+    return _validate_cached(str(file_path), stat.st_mtime_ns, stat.st_size)
+
+
 def print_results(passed: bool, results: dict):
     """Print validation results."""
 
@@ -206,24 +256,50 @@ def print_results(passed: bool, results: dict):
         print("\nPlease address the issues above before finalizing the plan.")
 
 
+# Below this many plans, process-pool startup costs more than it saves
+_MIN_PARALLEL_FILES = 4
+
+
 def main():
-    if len(sys.argv) != 2:
-        print("Usage: python check_plan_completeness.py <path/to/plan.md>")
+    # Accept several plans per invocation so repo-wide validation pays
+    # interpreter startup and regex compilation once, not once per file.
+    if len(sys.argv) < 2:
+        print("Usage: python check_plan_completeness.py <path/to/plan.md> [more plans...]")
         sys.exit(1)
 
-    file_path = Path(sys.argv[1])
+    all_passed = True
+
+    found = []
+    for arg in sys.argv[1:]:
+        file_path = Path(arg)
+        if file_path.exists():
+            found.append(file_path)
+        else:
+            print(f"Error: File not found: {file_path}")
+            all_passed = False
+
+    # Validation is pure CPU with no shared state, so large batches
+    # fan out across cores; results print in input order either way.
+    if len(found) >= _MIN_PARALLEL_FILES:
+        with ProcessPoolExecutor() as executor:
+            outcomes = list(executor.map(validate_plan, found, chunksize=8))
+    else:
+        outcomes = [validate_plan_cached(file_path) for file_path in found]
 
-    if not file_path.exists():
-        print(f"Error: File not found: {file_path}")
-        sys.exit(1)
+    for idx, (file_path, (passed, results)) in enumerate(zip(found, outcomes)):
+        if idx:
+            print()
+
+        if not file_path.name == "plan.md":
+            print(f"Warning: Expected 'plan.md', got '{file_path.name}'")
 
-    if not file_path.name == "plan.md":
-        print(f"Warning: Expected 'plan.md', got '{file_path.name}'")
+        print(f"Validating plan: {file_path}")
+        print("-" * 60)
 
-    passed, results = validate_plan(file_path)
-    print_results(passed, results)
+        print_results(passed, results)
+        all_passed = all_passed and passed
 
-    sys.exit(0 if passed else 1)
+    sys.exit(0 if all_passed else 1)
 
 
 if __name__ == "__main__":
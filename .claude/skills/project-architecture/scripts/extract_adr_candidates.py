@@ -12,10 +12,20 @@ Output:
     List of potential ADR-worthy decisions with significance assessment
 """
 
+import functools
 import sys
 import re
+from dataclasses import dataclass
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import Iterator, List, Dict, Optional, Tuple
+
+# Optional C-backed multi-pattern matcher; the regex alternations below are
+# the fallback when it isn't installed
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 # Keywords indicating decision-making
 DECISION_KEYWORDS = [
@@ -51,134 +61,265 @@ HIGH_IMPACT_AREAS = [
 ]
 
 
-def read_file(file_path: Path) -> str:
-    """Read file content."""
-    try:
-        return file_path.read_text(encoding='utf-8')
-    except Exception as e:
-        print(f"Error reading file: {e}")
-        sys.exit(1)
+# All patterns are ASCII, so the analysis operates on raw bytes: no UTF-8
+# decode of the whole file, and `re` on bytes scans a smaller buffer.
+# Text is decoded on demand where it becomes user-facing output.
+
+# Compiled patterns are built lazily (and cached on first use) so importing
+# the module or printing usage doesn't pay for the compilations up front.
+
+@functools.cache
+def _section_split_re() -> 're.Pattern':
+    """Split point just before each section header.
+
+    Splitting beats a lazy `(.*?)(?=\\n##)` body match, which backtracks
+    character-by-character when the next header is far away.
+    """
+    return re.compile(rb'(?m)^(?=##\s+)')
+
+
+@functools.cache
+def _fence_re() -> 're.Pattern':
+    """Fenced code blocks (may span blank lines; excise before splitting)."""
+    return re.compile(rb'```.*?```', re.DOTALL)
+
+
+# First letters (as byte values) of all scoring keywords: a paragraph sharing
+# none of these bytes cannot score, so the regex passes can be skipped entirely.
+_TRIGGER_CHARS = frozenset(
+    keyword.replace('\\b', '').lower().encode('ascii')[0]
+    for keyword in (
+        DECISION_KEYWORDS + ALTERNATIVES_KEYWORDS
+        + TRADEOFF_KEYWORDS + HIGH_IMPACT_AREAS
+    )
+)
+
+
+def _compile_keywords(keywords: List[str]) -> 're.Pattern':
+    """Compile a keyword list into a single bytes alternation pattern."""
+    return re.compile("|".join(keywords).encode('ascii'))
 
 
-def extract_sections(content: str) -> Dict[str, str]:
-    """Extract sections from plan.md."""
-    sections = {}
-    pattern = r'##\s+(.+?)\n(.*?)(?=\n##\s+|\Z)'
-    matches = re.finditer(pattern, content, re.DOTALL)
+# One compiled alternation per category: each paragraph is scanned once
+# per category instead of once per keyword.
 
-    for match in matches:
-        section_name = match.group(1).strip()
-        section_content = match.group(2).strip()
-        sections[section_name] = section_content
+@functools.cache
+def _decision_re() -> 're.Pattern':
+    return _compile_keywords(DECISION_KEYWORDS)
 
-    return sections
 
+@functools.cache
+def _alternatives_re() -> 're.Pattern':
+    return _compile_keywords(ALTERNATIVES_KEYWORDS)
 
-def score_decision_language(text: str) -> int:
-    """Score text based on decision-making language."""
-    score = 0
-    text_lower = text.lower()
 
-    for keyword in DECISION_KEYWORDS:
-        if re.search(keyword, text_lower):
-            score += 1
+@functools.cache
+def _tradeoff_re() -> 're.Pattern':
+    return _compile_keywords(TRADEOFF_KEYWORDS)
 
-    return score
 
+@functools.cache
+def _impact_re() -> 're.Pattern':
+    return _compile_keywords(HIGH_IMPACT_AREAS)
 
-def score_alternatives(text: str) -> int:
-    """Score text based on alternatives consideration."""
-    score = 0
-    text_lower = text.lower()
 
-    for keyword in ALTERNATIVES_KEYWORDS:
-        if re.search(keyword, text_lower):
-            score += 2  # Alternatives weigh more heavily
+def _count_distinct_keywords(pattern: 're.Pattern', text_lower: bytes) -> int:
+    """Count distinct keywords matched (each keyword scores once, as before)."""
+    return len({match.group(0) for match in pattern.finditer(text_lower)})
+
+
+# Category weights, mirroring the individual scorer functions below
+_CATEGORY_WEIGHTS = [
+    ('decision', 1, DECISION_KEYWORDS),
+    ('alternatives', 2, ALTERNATIVES_KEYWORDS),
+    ('tradeoffs', 2, TRADEOFF_KEYWORDS),
+    ('impact', 3, HIGH_IMPACT_AREAS),
+]
+
+
+@functools.cache
+def _keyword_automaton():
+    """Aho-Corasick automaton over every scoring keyword, or None when the
+    optional pyahocorasick dependency is unavailable."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for category, weight, keywords in _CATEGORY_WEIGHTS:
+        for keyword in keywords:
+            word = keyword.replace('\\b', '')
+            automaton.add_word(word, (category, weight, word))
+    automaton.make_automaton()
+    return automaton
+
+
+def _is_word_char(char: str) -> bool:
+    """ASCII \\w, matching the byte-pattern word boundaries of the fallback."""
+    return char.isascii() and (char.isalnum() or char == '_')
+
+
+def _score_paragraph(paragraph_lower: bytes) -> Dict[str, int]:
+    """Score one paragraph across all four categories.
+
+    With pyahocorasick installed this is a single pass over the text instead
+    of four alternation scans; results are identical either way.
+    """
+    automaton = _keyword_automaton()
+    if automaton is None:
+        return {
+            'decision': score_decision_language(paragraph_lower),
+            'alternatives': score_alternatives(paragraph_lower),
+            'tradeoffs': score_tradeoffs(paragraph_lower),
+            'impact': score_impact(paragraph_lower),
+        }
+
+    # latin-1 maps bytes 1:1 to code points, so offsets stay aligned
+    text = paragraph_lower.decode('latin-1')
+    scores = {'decision': 0, 'alternatives': 0, 'tradeoffs': 0, 'impact': 0}
+    seen = set()
+    for end, (category, weight, word) in automaton.iter(text):
+        start = end - len(word) + 1
+        # Enforce the \b boundaries the regex keywords carry
+        if start > 0 and _is_word_char(text[start - 1]):
+            continue
+        if end + 1 < len(text) and _is_word_char(text[end + 1]):
+            continue
+        # Each keyword still scores at most once per paragraph
+        if word in seen:
+            continue
+        seen.add(word)
+        scores[category] += weight
+    return scores
+
+
+@dataclass(slots=True)
+class Candidate:
+    """One scored paragraph; slots keep hundreds of these cheap to hold
+    and fast to access in the sort/summary paths."""
+    section: str
+    paragraph_idx: int
+    content: bytes
+    decision: int
+    alternatives: int
+    tradeoffs: int
+    impact: int
+    total: int
+    assessment: Optional[Tuple[bool, str]] = None
+
+
+def read_file(file_path: Path) -> bytes:
+    """Read file content as raw bytes, with newlines normalized to LF."""
+    try:
+        # read_text() translated universal newlines; keep that behavior so
+        # blank-line paragraph splits still work on CRLF plans
+        return file_path.read_bytes().replace(b'\r\n', b'\n')
+    except Exception as e:
+        print(f"Error reading file: {e}")
+        sys.exit(1)
+
 
-    return score
+def iter_sections(content: bytes) -> Iterator[Tuple[str, bytes]]:
+    """Yield (name, content) for each section of plan.md as it is found."""
+    for part in _section_split_re().split(content):
+        if not part.startswith(b'##'):
+            continue  # preamble before the first section header
+        header, _, body = part.partition(b'\n')
+        name = header.lstrip(b'#').strip().decode('utf-8', 'replace')
+        yield name, body.strip()
 
 
-def score_tradeoffs(text: str) -> int:
-    """Score text based on tradeoff discussion."""
-    score = 0
-    text_lower = text.lower()
+def score_decision_language(text_lower: bytes) -> int:
+    """Score lowercased text based on decision-making language."""
+    return _count_distinct_keywords(_decision_re(), text_lower)
 
-    for keyword in TRADEOFF_KEYWORDS:
-        if re.search(keyword, text_lower):
-            score += 2  # Tradeoffs weigh more heavily
 
-    return score
+def score_alternatives(text_lower: bytes) -> int:
+    """Score lowercased text based on alternatives consideration."""
+    # Alternatives weigh more heavily
+    return 2 * _count_distinct_keywords(_alternatives_re(), text_lower)
 
 
-def score_impact(text: str) -> int:
-    """Score text based on high-impact areas."""
-    score = 0
-    text_lower = text.lower()
+def score_tradeoffs(text_lower: bytes) -> int:
+    """Score lowercased text based on tradeoff discussion."""
+    # Tradeoffs weigh more heavily
+    return 2 * _count_distinct_keywords(_tradeoff_re(), text_lower)
 
-    for area in HIGH_IMPACT_AREAS:
-        if re.search(area, text_lower):
-            score += 3  # High impact areas weigh most
 
-    return score
+def score_impact(text_lower: bytes) -> int:
+    """Score lowercased text based on high-impact areas."""
+    # High impact areas weigh most
+    return 3 * _count_distinct_keywords(_impact_re(), text_lower)
 
 
-def extract_paragraph_context(content: str, start_pos: int, context_size: int = 500) -> str:
+def extract_paragraph_context(content: bytes, start_pos: int, context_size: int = 500) -> bytes:
     """Extract surrounding context for a match."""
     start = max(0, start_pos - context_size)
     end = min(len(content), start_pos + context_size)
     return content[start:end].strip()
 
 
-def analyze_section(section_name: str, section_content: str) -> List[Dict]:
+def analyze_section(section_name: str, section_content: bytes) -> List[Candidate]:
     """Analyze a section for ADR candidates."""
     candidates = []
 
+    # Remove fenced code blocks up front; splitting on blank lines would
+    # otherwise break inside multi-paragraph fences and score their content
+    body = _fence_re().sub(b'', section_content)
+
     # Split into paragraphs
-    paragraphs = [p.strip() for p in section_content.split('\n\n') if p.strip()]
+    paragraphs = [p.strip() for p in body.split(b'\n\n') if p.strip()]
 
     for para_idx, paragraph in enumerate(paragraphs):
-        # Skip code blocks
-        if paragraph.startswith('```') or paragraph.startswith('    '):
+        # Skip indented code blocks, and unterminated fences the excision
+        # above could not pair up
+        if paragraph.startswith(b'```') or paragraph.startswith(b'    '):
+            continue
+
+        # Lowercase once; every scorer reuses the same string
+        paragraph_lower = paragraph.lower()
+
+        # Prefilter before paying for the keyword regexes: short-circuits on
+        # the first trigger byte, and scans the whole paragraph so keywords
+        # past a letter-free prefix are never skipped
+        if not any(byte in _TRIGGER_CHARS for byte in paragraph_lower):
             continue
 
         # Calculate significance scores
-        decision_score = score_decision_language(paragraph)
-        alternatives_score = score_alternatives(paragraph)
-        tradeoff_score = score_tradeoffs(paragraph)
-        impact_score = score_impact(paragraph)
+        category_scores = _score_paragraph(paragraph_lower)
+        decision_score = category_scores['decision']
+        alternatives_score = category_scores['alternatives']
+        tradeoff_score = category_scores['tradeoffs']
+        impact_score = category_scores['impact']
 
         total_score = decision_score + alternatives_score + tradeoff_score + impact_score
 
         # Threshold for potential ADR candidate
         if total_score >= 6:
-            candidates.append({
-                'section': section_name,
-                'paragraph_idx': para_idx,
-                'content': paragraph[:200] + ('...' if len(paragraph) > 200 else ''),
-                'scores': {
-                    'decision': decision_score,
-                    'alternatives': alternatives_score,
-                    'tradeoffs': tradeoff_score,
-                    'impact': impact_score,
-                    'total': total_score,
-                },
-            })
+            candidates.append(Candidate(
+                section=section_name,
+                paragraph_idx=para_idx,
+                content=_truncate_utf8(paragraph, 200)
+                + (b'...' if len(paragraph) > 200 else b''),
+                decision=decision_score,
+                alternatives=alternatives_score,
+                tradeoffs=tradeoff_score,
+                impact=impact_score,
+                total=total_score,
+            ))
 
     return candidates
 
 
-def assess_significance(candidate: Dict) -> Tuple[bool, str]:
+def assess_significance(candidate: Candidate) -> Tuple[bool, str]:
     """Apply 3-part ADR significance test."""
-    scores = candidate['scores']
 
     # Test 1: Impact (needs high impact score)
-    has_impact = scores['impact'] >= 3
+    has_impact = candidate.impact >= 3
 
     # Test 2: Alternatives (needs alternatives discussion)
-    has_alternatives = scores['alternatives'] >= 2
+    has_alternatives = candidate.alternatives >= 2
 
     # Test 3: Scope (inferred from section name and impact)
-    section = candidate['section'].lower()
+    section = candidate.section.lower()
     cross_cutting_sections = ['architecture', 'technical context', 'key decisions', 'interfaces']
     is_cross_cutting = any(keyword in section for keyword in cross_cutting_sections)
 
@@ -203,48 +344,57 @@ def assess_significance(candidate: Dict) -> Tuple[bool, str]:
     return passes_all, assessment
 
 
-def extract_decision_title(content: str) -> str:
-    """Extract a potential decision title from content."""
-    # Look for sentences with decision keywords
-    sentences = re.split(r'[.!?]', content)
+def _truncate_utf8(data: bytes, limit: int) -> bytes:
+    """Trim to at most `limit` bytes without splitting a UTF-8 sequence."""
+    if len(data) <= limit:
+        return data
+    cut = data[:limit]
+    # Back off a trailing partial multi-byte sequence
+    while cut and (cut[-1] & 0xC0) == 0x80:
+        cut = cut[:-1]
+    if cut and cut[-1] >= 0xC0:
+        cut = cut[:-1]
+    return cut
+
+
+def _iter_sentences(text: bytes) -> Iterator[bytes]:
+    """Yield sentences lazily so callers can stop at the first hit."""
+    start = 0
+    for i, char in enumerate(text):
+        if char in b'.!?':
+            yield text[start:i]
+            start = i + 1
+    yield text[start:]
 
-    for sentence in sentences:
-        sentence_lower = sentence.lower()
-        if any(re.search(keyword, sentence_lower) for keyword in DECISION_KEYWORDS):
+
+def extract_decision_title(content: bytes) -> str:
+    """Extract a potential decision title from content."""
+    # Look for sentences with decision keywords, stopping at the first one
+    for sentence in _iter_sentences(content):
+        if _decision_re().search(sentence.lower()):
             # Clean and truncate
             title = sentence.strip()
-            title = re.sub(r'^(we|the|this)\s+', '', title, flags=re.IGNORECASE)
+            title = re.sub(rb'^(we|the|this)\s+', b'', title, flags=re.IGNORECASE)
             if len(title) > 80:
-                title = title[:77] + '...'
-            return title
+                title = _truncate_utf8(title, 77) + b'...'
+            return title.decode('utf-8', 'replace')
 
-    return "Decision in " + content[:50] + "..."
+    return "Decision in " + _truncate_utf8(content, 50).decode('utf-8', 'replace') + "..."
 
 
-def main():
-    if len(sys.argv) != 2:
-        print("Usage: python extract_adr_candidates.py <path/to/plan.md>")
-        sys.exit(1)
-
-    file_path = Path(sys.argv[1])
-
-    if not file_path.exists():
-        print(f"Error: File not found: {file_path}")
-        sys.exit(1)
-
+def analyze_plan(file_path: Path):
+    """Analyze one plan and print its ADR candidates."""
     print(f"Analyzing plan: {file_path}")
     print("=" * 80)
     print()
 
     content = read_file(file_path)
-    sections = extract_sections(content)
 
     all_candidates = []
 
-    # Analyze each section
-    for section_name, section_content in sections.items():
-        candidates = analyze_section(section_name, section_content)
-        all_candidates.extend(candidates)
+    # Analyze each section as it streams by; no intermediate section dict
+    for section_name, section_content in iter_sections(content):
+        all_candidates.extend(analyze_section(section_name, section_content))
 
     if not all_candidates:
         print("No potential ADR candidates found.")
@@ -256,28 +406,29 @@ def main():
         return
 
     # Sort by total score (highest first)
-    all_candidates.sort(key=lambda c: c['scores']['total'], reverse=True)
+    all_candidates.sort(key=attrgetter('total'), reverse=True)
 
     print(f"Found {len(all_candidates)} potential ADR candidates:")
     print()
 
     for idx, candidate in enumerate(all_candidates, 1):
-        passes_test, assessment = assess_significance(candidate)
+        # Assess once and remember the result for the summary below
+        passes_test, assessment = candidate.assessment = assess_significance(candidate)
 
-        decision_title = extract_decision_title(candidate['content'])
+        decision_title = extract_decision_title(candidate.content)
 
         print(f"{idx}. {assessment}")
-        print(f"   Section: {candidate['section']}")
+        print(f"   Section: {candidate.section}")
         print(f"   Suggested Title: {decision_title}")
-        print(f"   Score: {candidate['scores']['total']} "
-              f"(impact={candidate['scores']['impact']}, "
-              f"alternatives={candidate['scores']['alternatives']}, "
-              f"tradeoffs={candidate['scores']['tradeoffs']})")
-        print(f"   Content: {candidate['content']}")
+        print(f"   Score: {candidate.total} "
+              f"(impact={candidate.impact}, "
+              f"alternatives={candidate.alternatives}, "
+              f"tradeoffs={candidate.tradeoffs})")
+        print(f"   Content: {candidate.content.decode('utf-8', 'replace')}")
         print()
 
     # Summary
-    high_priority = sum(1 for c in all_candidates if assess_significance(c)[0])
+    high_priority = sum(1 for c in all_candidates if c.assessment[0])
     print("=" * 80)
     print(f"Summary: {high_priority} high-priority candidates, "
           f"{len(all_candidates) - high_priority} lower-priority")
@@ -289,5 +440,31 @@ def main():
     print("     'Document reasoning and tradeoffs? Run `/sp.adr <decision-title>`'")
 
 
+def main():
+    # Accept several plans per invocation so repo-wide analysis pays
+    # interpreter startup and regex compilation once, not once per file.
+    if len(sys.argv) < 2:
+        print("Usage: python extract_adr_candidates.py <path/to/plan.md> [more plans...]")
+        sys.exit(1)
+
+    missing = False
+
+    for idx, arg in enumerate(sys.argv[1:]):
+        if idx:
+            print()
+
+        file_path = Path(arg)
+
+        if not file_path.exists():
+            print(f"Error: File not found: {file_path}")
+            missing = True
+            continue
+
+        analyze_plan(file_path)
+
+    if missing:
+        sys.exit(1)
+
+
 if __name__ == "__main__":
     main()